@@ -6,121 +6,126 @@ Creates CSV files that can be easily converted to Excel format
 
 import csv
 import random
-from datetime import datetime, timedelta
+from array import array
+from datetime import date, datetime, timedelta
+
+# Output files are buffered in 1 MiB chunks rather than the default 8 KiB
+WRITE_BUFFER_SIZE = 1 << 20
+
+def uniform_column(low, high, n, ndigits=None):
+    """Draw n floats uniformly from [low, high) into a typed array, optionally rounded to ndigits"""
+    rand = random.random
+    span = high - low
+    if ndigits is None:
+        return array('d', (low + span * rand() for _ in range(n)))
+    return array('d', (round(low + span * rand(), ndigits) for _ in range(n)))
+
+def randint_column(low, high, n):
+    """Draw n integers uniformly from [low, high] in a single batch into a typed array"""
+    return array('q', random.choices(range(low, high + 1), k=n))
+
+def write_csv(filename, headers, columns):
+    """Write column iterables to a CSV file, streaming rows as they are zipped"""
+    with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)
+        writer.writerows(zip(*columns))
 
 def generate_fintech_data():
-    """Generate sample financial data"""
+    """Generate sample financial data, returning the filename and row count"""
     symbols = ["AAPL", "TSLA", "GOOG", "MSFT", "AMZN", "META"]
     start_date = datetime(2024, 1, 1)
     days = 90
     
-    rows = []
-    for day in range(days):
-        date = start_date + timedelta(days=day)
-        for symbol in symbols:
-            price = round(random.uniform(100, 400), 2)
-            volume = random.randint(1_000_000, 50_000_000)
-            sentiment = round(random.uniform(0.3, 0.95), 2)
-            market_cap = round(price * random.uniform(1_000_000, 10_000_000), 0)
-            rows.append([
-                date.strftime('%Y-%m-%d'),
-                symbol,
-                price,
-                volume,
-                sentiment,
-                market_cap
-            ])
+    n = days * len(symbols)
+    
+    # Build each column in a single pass instead of drawing cell by cell;
+    # derived columns are generators so they are only produced as rows are written
+    date_strs = [(start_date + timedelta(days=day)).strftime('%Y-%m-%d') for day in range(days)]
+    dates = (date_str for date_str in date_strs for _ in symbols)
+    symbol_col = (symbol for _ in range(days) for symbol in symbols)
+    prices = uniform_column(100, 400, n, 2)
+    volumes = randint_column(1_000_000, 50_000_000, n)
+    sentiments = uniform_column(0.3, 0.95, n, 2)
+    market_caps = (round(price * factor, 0)
+                   for price, factor in zip(prices, uniform_column(1_000_000, 10_000_000, n)))
     
     # Write to CSV
-    with open('sample_fintech_data.csv', 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerow(["Date", "Symbol", "Price", "Volume", "SentimentScore", "MarketCap"])
-        writer.writerows(rows)
+    write_csv('sample_fintech_data.csv',
+              ["Date", "Symbol", "Price", "Volume", "SentimentScore", "MarketCap"],
+              [dates, symbol_col, prices, volumes, sentiments, market_caps])
     
-    print("✅ sample_fintech_data.csv created successfully!")
-    print(f"📊 Generated {len(rows)} rows of financial data")
+    return 'sample_fintech_data.csv', n
 
 def generate_sales_data():
-    """Generate sample sales data"""
+    """Generate sample sales data, returning the filename and row count"""
     products = ["Laptop", "Phone", "Tablet", "Headphones", "Monitor", "Keyboard", "Mouse"]
     regions = ["North America", "Europe", "Asia", "South America", "Africa"]
     sales_reps = ["Alice Johnson", "Bob Smith", "Carol Davis", "David Wilson", "Eva Brown"]
     
-    rows = []
-    for month in range(1, 13):  # 12 months
-        for _ in range(random.randint(50, 100)):  # Random sales per month
-            date = datetime(2024, month, random.randint(1, 28))
-            product = random.choice(products)
-            region = random.choice(regions)
-            sales_rep = random.choice(sales_reps)
-            quantity = random.randint(1, 20)
-            unit_price = round(random.uniform(50, 2000), 2)
-            total_sales = round(quantity * unit_price, 2)
-            
-            rows.append([
-                date.strftime('%Y-%m-%d'),
-                product,
-                region,
-                sales_rep,
-                quantity,
-                unit_price,
-                total_sales
-            ])
+    # Random number of sales per month, then one pass per column
+    months = [month for month in range(1, 13) for _ in range(random.randint(50, 100))]
+    n = len(months)
+    
+    dates = (f"2024-{month:02d}-{day:02d}" for month, day in zip(months, randint_column(1, 28, n)))
+    product_col = random.choices(products, k=n)
+    region_col = random.choices(regions, k=n)
+    rep_col = random.choices(sales_reps, k=n)
+    quantities = randint_column(1, 20, n)
+    unit_prices = uniform_column(50, 2000, n, 2)
+    totals = (round(q * p, 2) for q, p in zip(quantities, unit_prices))
     
     # Write to CSV
-    with open('sample_sales_data.csv', 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerow(["Date", "Product", "Region", "SalesRep", "Quantity", "UnitPrice", "TotalSales"])
-        writer.writerows(rows)
+    write_csv('sample_sales_data.csv',
+              ["Date", "Product", "Region", "SalesRep", "Quantity", "UnitPrice", "TotalSales"],
+              [dates, product_col, region_col, rep_col, quantities, unit_prices, totals])
     
-    print("✅ sample_sales_data.csv created successfully!")
-    print(f"📊 Generated {len(rows)} rows of sales data")
+    return 'sample_sales_data.csv', n
 
 def generate_employee_data():
-    """Generate sample employee data"""
+    """Generate sample employee data, returning the filename and row count"""
     departments = ["Engineering", "Marketing", "Sales", "HR", "Finance", "Operations"]
     positions = ["Manager", "Senior", "Junior", "Lead", "Director", "Analyst"]
     locations = ["New York", "San Francisco", "London", "Tokyo", "Berlin", "Sydney"]
     
-    rows = []
-    for i in range(500):  # 500 employees
-        employee_id = f"EMP{i+1:04d}"
-        name = f"Employee {i+1}"
-        department = random.choice(departments)
-        position = f"{random.choice(positions)} {department.rstrip('s')}"
-        location = random.choice(locations)
-        salary = random.randint(40000, 200000)
-        hire_date = datetime(2020, 1, 1) + timedelta(days=random.randint(0, 1460))
-        performance_score = round(random.uniform(2.5, 5.0), 1)
-        
-        rows.append([
-            employee_id,
-            name,
-            department,
-            position,
-            location,
-            salary,
-            hire_date.strftime('%Y-%m-%d'),
-            performance_score
-        ])
+    n = 500  # 500 employees
+    
+    employee_ids = (f"EMP{i+1:04d}" for i in range(n))
+    names = (f"Employee {i+1}" for i in range(n))
+    # Every department/position pairing is formatted once; each employee draws one pair
+    roles = [(department, f"{position} {department.rstrip('s')}")
+             for position in positions for department in departments]
+    department_col, position_col = zip(*random.choices(roles, k=n))
+    location_col = random.choices(locations, k=n)
+    salaries = randint_column(40000, 200000, n)
+    # Only 1461 hire dates are possible, so format each once and index by offset
+    hire_base = date(2020, 1, 1).toordinal()
+    hire_date_strs = [date.fromordinal(hire_base + day).isoformat() for day in range(1461)]
+    hire_dates = (hire_date_strs[offset] for offset in randint_column(0, 1460, n))
+    performance_scores = uniform_column(2.5, 5.0, n, 1)
     
     # Write to CSV
-    with open('sample_employee_data.csv', 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerow(["EmployeeID", "Name", "Department", "Position", "Location", "Salary", "HireDate", "PerformanceScore"])
-        writer.writerows(rows)
+    write_csv('sample_employee_data.csv',
+              ["EmployeeID", "Name", "Department", "Position", "Location", "Salary", "HireDate", "PerformanceScore"],
+              [employee_ids, names, department_col, position_col, location_col,
+               salaries, hire_dates, performance_scores])
     
-    print("✅ sample_employee_data.csv created successfully!")
-    print(f"📊 Generated {len(rows)} rows of employee data")
+    return 'sample_employee_data.csv', n
 
 def main():
     """Generate all sample datasets"""
     print("🚀 Generating sample data for AI Analytics App...")
     print()
     
-    generate_fintech_data()
-    generate_sales_data()
-    generate_employee_data()
+    datasets = [
+        (generate_fintech_data, "financial"),
+        (generate_sales_data, "sales"),
+        (generate_employee_data, "employee"),
+    ]
+    for generator, kind in datasets:
+        filename, row_count = generator()
+        print(f"✅ {filename} created successfully!")
+        print(f"📊 Generated {row_count} rows of {kind} data")
     
     print()
     print("🎉 All sample data files created!")
@@ -4,19 +4,77 @@ Simple Excel File Generator using only built-in Python libraries
 Creates .xlsx files by generating the XML structure manually
 """
 
+import re
+import string
 import zipfile
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import random
-import os
+from array import array
+
+# Worksheet XML is flushed to the archive whenever the buffer exceeds this size
+FLUSH_SIZE = 128 * 1024
+
+# Excel column names A..XFD, the 16384-column limit of the format
+MAX_COLUMNS = 16384
+COLUMN_LETTERS = (
+    list(string.ascii_uppercase)
+    + [first + second for first in string.ascii_uppercase for second in string.ascii_uppercase]
+    + [first + second + third for first in string.ascii_uppercase
+       for second in string.ascii_uppercase for third in string.ascii_uppercase]
+)[:MAX_COLUMNS]
+
+# Single-pass XML escaping, skipped entirely for text without special characters
+XML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'})
+NEEDS_ESCAPE = re.compile(r'[&<>"\']').search
+
+# Package parts that do not depend on the sheet data
+STATIC_PARTS = (
+    ('[Content_Types].xml', b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
+</Types>'''),
+    ('_rels/.rels', b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>'''),
+    ('xl/workbook.xml', b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets>
+<sheet name="Sheet1" sheetId="1" r:id="rId1"/>
+</sheets>
+</workbook>'''),
+    ('xl/_rels/workbook.xml.rels', b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>
+</Relationships>'''),
+)
+
+def uniform_column(low, high, n, ndigits):
+    """Draw n floats uniformly from [low, high) into a typed array, rounded to ndigits"""
+    rand = random.random
+    span = high - low
+    return array('d', (round(low + span * rand(), ndigits) for _ in range(n)))
+
+def randint_column(low, high, n):
+    """Draw n integers uniformly from [low, high] in a single batch into a typed array"""
+    return array('q', random.choices(range(low, high + 1), k=n))
 
 class SimpleExcelWriter:
     def __init__(self, filename):
         self.filename = filename
         self.sheets = []
+        self.shared_strings = {}
     
     def add_sheet(self, name, headers, rows):
         """Add a worksheet with headers and data rows"""
+        if len(headers) > MAX_COLUMNS:
+            raise ValueError(f"Excel sheets support at most {MAX_COLUMNS} columns, got {len(headers)} headers")
         self.sheets.append({
             'name': name,
             'headers': headers,
@@ -25,113 +83,88 @@ class SimpleExcelWriter:
     
     def save(self):
         """Save the Excel file"""
-        # Create temporary directory structure
-        temp_dir = f"{self.filename}_temp"
-        os.makedirs(temp_dir, exist_ok=True)
-        os.makedirs(f"{temp_dir}/_rels", exist_ok=True)
-        os.makedirs(f"{temp_dir}/xl", exist_ok=True)
-        os.makedirs(f"{temp_dir}/xl/_rels", exist_ok=True)
-        os.makedirs(f"{temp_dir}/xl/worksheets", exist_ok=True)
-        
-        # Create [Content_Types].xml
-        self._create_content_types(temp_dir)
-        
-        # Create _rels/.rels
-        self._create_main_rels(temp_dir)
-        
-        # Create xl/workbook.xml
-        self._create_workbook(temp_dir)
-        
-        # Create xl/_rels/workbook.xml.rels
-        self._create_workbook_rels(temp_dir)
-        
-        # Create worksheets
-        for i, sheet in enumerate(self.sheets):
-            self._create_worksheet(temp_dir, i + 1, sheet)
+        self.shared_strings = {}
         
-        # Create ZIP file
-        with zipfile.ZipFile(self.filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arc_path = os.path.relpath(file_path, temp_dir)
-                    zipf.write(file_path, arc_path)
-        
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(temp_dir)
-    
-    def _create_content_types(self, temp_dir):
-        content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-<Default Extension="xml" ContentType="application/xml"/>
-<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
-<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
-</Types>'''
-        with open(f"{temp_dir}/[Content_Types].xml", 'w') as f:
-            f.write(content)
-    
-    def _create_main_rels(self, temp_dir):
-        content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
-</Relationships>'''
-        with open(f"{temp_dir}/_rels/.rels", 'w') as f:
-            f.write(content)
-    
-    def _create_workbook(self, temp_dir):
-        content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
-<sheets>
-<sheet name="Sheet1" sheetId="1" r:id="rId1"/>
-</sheets>
-</workbook>'''
-        with open(f"{temp_dir}/xl/workbook.xml", 'w') as f:
-            f.write(content)
-    
-    def _create_workbook_rels(self, temp_dir):
-        content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
-</Relationships>'''
-        with open(f"{temp_dir}/xl/_rels/workbook.xml.rels", 'w') as f:
-            f.write(content)
-    
-    def _create_worksheet(self, temp_dir, sheet_num, sheet_data):
-        # Start worksheet XML
-        content = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        # Fastest deflate level for the worksheets; the small parts are stored as-is
+        with zipfile.ZipFile(self.filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            for arc_path, content in STATIC_PARTS:
+                zipf.writestr(arc_path, content, compress_type=zipfile.ZIP_STORED)
+            
+            # Stream worksheets straight into the archive
+            for i, sheet in enumerate(self.sheets):
+                self._create_worksheet(zipf, i + 1, sheet)
+            
+            # Strings interned while writing the worksheets
+            zipf.writestr('xl/sharedStrings.xml', self._create_shared_strings())
+    
+    def _create_worksheet(self, zipf, sheet_num, sheet_data):
+        # The entry size is unknown up front, so allow it to grow past 2 GiB
+        with zipf.open(f"xl/worksheets/sheet{sheet_num}.xml", 'w', force_zip64=True) as out:
+            buf = bytearray()
+            append = buf.extend
+            intern = self._intern
+            number_types = (int, float)
+            
+            # Start worksheet XML
+            append(b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
-<sheetData>'''
-        
-        # Add headers
-        content += f'<row r="1">'
-        for col_idx, header in enumerate(sheet_data['headers']):
-            col_letter = chr(65 + col_idx)  # A, B, C, etc.
-            content += f'<c r="{col_letter}1" t="inlineStr"><is><t>{self._escape_xml(str(header))}</t></is></c>'
-        content += '</row>'
-        
-        # Add data rows
-        for row_idx, row in enumerate(sheet_data['rows']):
-            row_num = row_idx + 2  # Start from row 2 (after headers)
-            content += f'<row r="{row_num}">'
-            for col_idx, cell_value in enumerate(row):
-                col_letter = chr(65 + col_idx)
-                if isinstance(cell_value, (int, float)):
-                    content += f'<c r="{col_letter}{row_num}"><v>{cell_value}</v></c>'
-                else:
-                    content += f'<c r="{col_letter}{row_num}" t="inlineStr"><is><t>{self._escape_xml(str(cell_value))}</t></is></c>'
-            content += '</row>'
-        
-        content += '''</sheetData>
-</worksheet>'''
-        
-        with open(f"{temp_dir}/xl/worksheets/sheet{sheet_num}.xml", 'w') as f:
-            f.write(content)
+<sheetData>''')
+            
+            # Cell reference prefixes are the same for every row of a column
+            cell_prefixes = self._cell_prefixes(0, len(sheet_data['headers']))
+            
+            # Add headers
+            append(b'<row r="1">')
+            for cell_prefix, header in zip(cell_prefixes, sheet_data['headers']):
+                append(b'%s1" t="s"><v>%d</v></c>' % (cell_prefix, intern(header)))
+            append(b'</row>')
+            
+            # Add data rows, flushing to the archive in chunks
+            for row_num, row in enumerate(sheet_data['rows'], start=2):  # Start from row 2 (after headers)
+                if len(row) > len(cell_prefixes):
+                    # Rows wider than the header row still get every cell written
+                    cell_prefixes += self._cell_prefixes(len(cell_prefixes), len(row))
+                append(b'<row r="%d">' % row_num)
+                for cell_prefix, cell_value in zip(cell_prefixes, row):
+                    if isinstance(cell_value, number_types):
+                        append(b'%s%d"><v>%a</v></c>' % (cell_prefix, row_num, cell_value))
+                    else:
+                        append(b'%s%d" t="s"><v>%d</v></c>' % (cell_prefix, row_num, intern(cell_value)))
+                append(b'</row>')
+                if len(buf) > FLUSH_SIZE:
+                    out.write(buf)
+                    buf.clear()
+            
+            append(b'''</sheetData>
+</worksheet>''')
+            out.write(buf)
+    
+    def _cell_prefixes(self, start, stop):
+        """Return the encoded '<c r="X' prefixes for columns start to stop - 1"""
+        if stop > MAX_COLUMNS:
+            raise ValueError(f"Excel sheets support at most {MAX_COLUMNS} columns, got a row with {stop} cells")
+        return [b'<c r="%s' % col_letter.encode() for col_letter in COLUMN_LETTERS[start:stop]]
+    
+    def _intern(self, text):
+        """Return the shared string table index for text, adding it if new"""
+        text = str(text)
+        index = self.shared_strings.get(text)
+        if index is None:
+            index = self.shared_strings[text] = len(self.shared_strings)
+        return index
+    
+    def _create_shared_strings(self):
+        # Dicts keep insertion order, which matches the interned indices
+        items = ''.join(f'<si><t>{self._escape_xml(text)}</t></si>' for text in self.shared_strings)
+        return f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="{len(self.shared_strings)}">{items}</sst>'''
     
     def _escape_xml(self, text):
         """Escape XML special characters"""
-        return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&apos;')
+        text = str(text)
+        if NEEDS_ESCAPE(text) is None:
+            return text
+        return text.translate(XML_ESCAPES)
 
 def generate_sample_excel_files():
     """Generate sample Excel files for testing"""
@@ -139,15 +172,15 @@ def generate_sample_excel_files():
     # 1. Financial Data
     print("📊 Generating financial data Excel file...")
     symbols = ["AAPL", "TSLA", "GOOG", "MSFT", "AMZN", "META"]
-    financial_data = []
+    n = 100
     
-    for i in range(100):
-        date = f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
-        symbol = random.choice(symbols)
-        price = round(random.uniform(100, 400), 2)
-        volume = random.randint(1000000, 50000000)
-        sentiment = round(random.uniform(0.3, 0.95), 2)
-        financial_data.append([date, symbol, price, volume, sentiment])
+    dates = [f"2024-{month:02d}-{day:02d}"
+             for month, day in zip(randint_column(1, 12, n), randint_column(1, 28, n))]
+    symbol_col = random.choices(symbols, k=n)
+    prices = uniform_column(100, 400, n, 2)
+    volumes = randint_column(1000000, 50000000, n)
+    sentiments = uniform_column(0.3, 0.95, n, 2)
+    financial_data = list(zip(dates, symbol_col, prices, volumes, sentiments))
     
     excel_writer = SimpleExcelWriter("sample_financial_data.xlsx")
     excel_writer.add_sheet("Financial Data", 
@@ -160,16 +193,16 @@ def generate_sample_excel_files():
     print("📈 Generating sales data Excel file...")
     products = ["Laptop", "Phone", "Tablet", "Headphones", "Monitor"]
     regions = ["North America", "Europe", "Asia", "South America"]
-    sales_data = []
+    n = 150
     
-    for i in range(150):
-        date = f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
-        product = random.choice(products)
-        region = random.choice(regions)
-        quantity = random.randint(1, 50)
-        unit_price = round(random.uniform(50, 2000), 2)
-        total = round(quantity * unit_price, 2)
-        sales_data.append([date, product, region, quantity, unit_price, total])
+    dates = [f"2024-{month:02d}-{day:02d}"
+             for month, day in zip(randint_column(1, 12, n), randint_column(1, 28, n))]
+    product_col = random.choices(products, k=n)
+    region_col = random.choices(regions, k=n)
+    quantities = randint_column(1, 50, n)
+    unit_prices = uniform_column(50, 2000, n, 2)
+    totals = (round(q * p, 2) for q, p in zip(quantities, unit_prices))
+    sales_data = list(zip(dates, product_col, region_col, quantities, unit_prices, totals))
     
     excel_writer = SimpleExcelWriter("sample_sales_data.xlsx")
     excel_writer.add_sheet("Sales Data", 
@@ -181,16 +214,15 @@ def generate_sample_excel_files():
     # 3. Employee Data
     print("👥 Generating employee data Excel file...")
     departments = ["Engineering", "Marketing", "Sales", "HR", "Finance"]
-    employee_data = []
-    
-    for i in range(200):
-        emp_id = f"EMP{i+1:04d}"
-        name = f"Employee {i+1}"
-        department = random.choice(departments)
-        salary = random.randint(40000, 150000)
-        hire_year = random.randint(2020, 2024)
-        performance = round(random.uniform(2.5, 5.0), 1)
-        employee_data.append([emp_id, name, department, salary, hire_year, performance])
+    n = 200
+    
+    emp_ids = [f"EMP{i+1:04d}" for i in range(n)]
+    names = [f"Employee {i+1}" for i in range(n)]
+    department_col = random.choices(departments, k=n)
+    salaries = randint_column(40000, 150000, n)
+    hire_years = randint_column(2020, 2024, n)
+    performances = uniform_column(2.5, 5.0, n, 1)
+    employee_data = list(zip(emp_ids, names, department_col, salaries, hire_years, performances))
     
     excel_writer = SimpleExcelWriter("sample_employee_data.xlsx")
     excel_writer.add_sheet("Employee Data", 